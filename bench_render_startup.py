@@ -0,0 +1,145 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+from pathlib import Path
+
+# ------------------------------------------------------------------
+# Startup benchmark: import time + first-render latency, cold vs warm
+# ------------------------------------------------------------------
+# Every cold measurement runs in a fresh interpreter. Only stdlib is imported
+# at module level so the spawned render worker starts from the same state.
+#
+#   python bench_render_startup.py [--repeat 3] [--renders 5] [--days 7]
+
+REPO_DIR = Path(__file__).resolve().parent
+
+IMPORT_SNIPPETS = {
+    "dashboard modules (lazy)": "import plot_dashboard, cabinets_dashboard",
+    "plotly + pandas stack":    "import pandas, plotly.graph_objects, plotly.subplots",
+}
+
+
+def make_results(days: int = 7) -> dict:
+    """Synthetic `results` dict with the keys plot_dashboard() reads (15-min steps)."""
+    import numpy as np
+    import pandas as pd
+
+    idx = pd.date_range("2024-07-15", periods=days * 96, freq="15min")
+    hour = (idx.hour + idx.minute / 60).to_numpy()
+    load = pd.Series(800 + 400 * np.sin((hour - 6) / 24 * 2 * np.pi).clip(0), index=idx)
+    battery = pd.Series(np.where((hour >= 10) & (hour < 16), 150.0,
+                                 np.where(hour < 6, -150.0, 0.0)), index=idx)
+    grid_proj = load - battery
+    soc = (50 - battery.cumsum() / 96).clip(0, 100)
+
+    return {
+        "original_base": None,
+        "load_kw": load,
+        "grid_base": load,
+        "grid_proj": grid_proj,
+        "battery_dispatch": battery,
+        "soc_percent": soc,
+        "proj_cap": pd.Series(1000.0, index=idx),
+        "base_cap": pd.Series(1200.0, index=idx),
+        "base_tariff_rate": pd.Series(np.where((hour >= 9) & (hour < 22), 6.0, 2.5), index=idx),
+        "proj_tariff_rate": pd.Series(np.where((hour >= 9) & (hour < 22), 6.0, 2.5), index=idx),
+    }
+
+
+def _run_child(args: list, cwd: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(REPO_DIR), os.environ.get("PYTHONPATH")])))
+    out = subprocess.run([sys.executable, *args], cwd=cwd, env=env,
+                         capture_output=True, text=True, check=True)
+    # Renderers print export notices; the JSON payload is the last line
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _child_import(snippet: str):
+    t0 = time.perf_counter()
+    exec(snippet, {})
+    print(json.dumps({"import_s": time.perf_counter() - t0}))
+
+
+def _child_cold(days: int, renders: int):
+    t0 = time.perf_counter()
+    import plot_dashboard
+    import_s = time.perf_counter() - t0
+
+    results = make_results(days)   # pulls in pandas/numpy, but not plotly
+    times = []
+    for _ in range(renders):
+        t0 = time.perf_counter()
+        plot_dashboard.plot_dashboard(results)
+        times.append(time.perf_counter() - t0)
+    print(json.dumps({"import_s": import_s, "renders_s": times}))
+
+
+def _fmt(seconds: float) -> str:
+    return f"{seconds * 1000:9.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render worker startup benchmark (cold vs warm).")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh-interpreter runs per measurement")
+    parser.add_argument("--renders", type=int, default=5, help="renders per interpreter")
+    parser.add_argument("--days", type=int, default=7, help="days of 15-min data per render")
+    parser.add_argument("--child", choices=["import", "cold"], help=argparse.SUPPRESS)
+    parser.add_argument("--snippet", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child == "import":
+        return _child_import(args.snippet)
+    if args.child == "cold":
+        return _child_cold(args.days, args.renders)
+
+    script = str(Path(__file__).resolve())
+    with tempfile.TemporaryDirectory() as tmp:   # renderers write into ./result
+        # ---------- 1. Import time ----------
+        print("Import time (fresh interpreter, median of", args.repeat, "runs)")
+        for label, snippet in IMPORT_SNIPPETS.items():
+            runs = [_run_child([script, "--child", "import", "--snippet", snippet], tmp)["import_s"]
+                    for _ in range(args.repeat)]
+            print(f"  {label:<28}{_fmt(statistics.median(runs))}")
+
+        # ---------- 2. Cold worker: one interpreter per job, no prewarm ----------
+        cold = [_run_child([script, "--child", "cold", "--days", str(args.days),
+                            "--renders", str(args.renders)], tmp)
+                for _ in range(args.repeat)]
+        cold_first = statistics.median(r["renders_s"][0] for r in cold)
+        cold_rest = [t for r in cold for t in r["renders_s"][1:]]
+
+        # ---------- 3. Warm worker: prewarm once, then serve ----------
+        from render_worker import RenderWorker
+
+        results = make_results(args.days)
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            warm_startup, warm_prewarm, warm_first, warm_rest = [], [], [], []
+            for _ in range(args.repeat):
+                with RenderWorker() as worker:
+                    warm_startup.append(worker.startup_s)
+                    warm_prewarm.append(worker.prewarm_s)
+                    times = [worker.render("dashboard", results) for _ in range(args.renders)]
+                warm_first.append(times[0])
+                warm_rest.extend(times[1:])
+        finally:
+            os.chdir(cwd)
+
+    print(f"\nplot_dashboard latency ({args.days} days @ 15 min, median of {args.repeat} runs)")
+    print(f"  {'':<28}{'cold':>12}{'warm':>12}")
+    print(f"  {'worker startup':<28}{'-':>12}{_fmt(statistics.median(warm_startup)):>12}")
+    print(f"  {'  of which prewarm':<28}{'-':>12}{_fmt(statistics.median(warm_prewarm)):>12}")
+    print(f"  {'first render':<28}{_fmt(cold_first):>12}{_fmt(statistics.median(warm_first)):>12}")
+    if cold_rest and warm_rest:
+        print(f"  {'subsequent renders':<28}{_fmt(statistics.median(cold_rest)):>12}"
+              f"{_fmt(statistics.median(warm_rest)):>12}")
+
+
+if __name__ == "__main__":
+    main()
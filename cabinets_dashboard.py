@@ -1,9 +1,13 @@
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pandas as pd
 from pathlib import Path
 
+# plotly / pandas are imported inside the plotting functions so that importing
+# this module stays cheap for short-lived render workers (see render_worker.py).
+
 def plot_cabinet_results(results_by_cabinet: dict, optimal_cabinet: int = None):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    import pandas as pd
+
     if not results_by_cabinet:
         print("No results to plot.")
         return
@@ -228,6 +232,10 @@ def plot_cabinet_results(results_by_cabinet: dict, optimal_cabinet: int = None):
 
 
 def plot_optimal_detail(results: dict, config: dict):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    import pandas as pd
+
     opt = results["optimal_cabinet"]
     fm = opt["financial_metrics"]
     cfg = config
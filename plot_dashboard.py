@@ -1,8 +1,8 @@
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pandas as pd
 from pathlib import Path
 
+# plotly / pandas are imported inside the plotting function so that importing
+# this module stays cheap for short-lived render workers (see render_worker.py).
+
 # ------------------------------------------------------------------
 # INPUT: results dict from main()
 # ------------------------------------------------------------------
@@ -13,6 +13,10 @@ def plot_dashboard(results: dict, zoom_date: str | None = None):
     - TRUE synchronized zoom: zoom any panel → all panels follow
     - Uses only `results` (no cell dependency)
     """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    import pandas as pd
+
     # ---------- 1. Pull data from results ----------
     original_base = results.get("original_base")  # May be None
     load          = results["load_kw"]
@@ -0,0 +1,173 @@
+import time
+import multiprocessing as mp
+
+# ------------------------------------------------------------------
+# Long-lived renderer worker
+# ------------------------------------------------------------------
+# The dashboard modules import plotly / pandas lazily, so a fresh worker
+# pays for them (plus plotly's validator and template setup) on its first
+# figure.  This worker pays that cost once at startup via `prewarm()` and
+# then serves many render requests from the same interpreter.
+
+# request kind -> (module, function)
+RENDERERS = {
+    "dashboard":      ("plot_dashboard", "plot_dashboard"),
+    "cabinets":       ("cabinets_dashboard", "plot_cabinet_results"),
+    "optimal_detail": ("cabinets_dashboard", "plot_optimal_detail"),
+}
+
+
+def _resolve(kind: str):
+    if kind not in RENDERERS:
+        raise ValueError(f"Unknown render kind: {kind!r} (expected one of {sorted(RENDERERS)})")
+    module_name, func_name = RENDERERS[kind]
+    module = __import__(module_name)
+    return getattr(module, func_name)
+
+
+def prewarm() -> float:
+    """
+    Import plotly / pandas and exercise everything the dashboards touch once:
+    - templates (default + plotly_white)
+    - trace / layout validators for Scatter, Bar, Waterfall, Table
+    - make_subplots grid building, shapes, annotations, axis updates
+    - JSON serialization used by write_html, and the bundled plotly.js it inlines
+    Returns the elapsed time in seconds.
+    """
+    t0 = time.perf_counter()
+
+    import pandas as pd  # noqa: F401  (import cost only)
+    import plotly.io as pio
+    import plotly.graph_objects as go
+    from plotly.offline import get_plotlyjs
+    from plotly.subplots import make_subplots
+
+    pio.templates[pio.templates.default]
+    pio.templates["plotly_white"]
+
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=["warm", "warm"],
+        vertical_spacing=0.07,
+        row_heights=[0.5, 0.5],
+    )
+    fig.add_trace(go.Scatter(x=[0, 1], y=[0, 1], name="warm", mode="markers+lines",
+                             fill="tozeroy", fillcolor="rgba(0,0,0,0.1)",
+                             line=dict(color="black", width=1, dash="dash"),
+                             marker=dict(size=1, symbol="star", color="gold")), row=1, col=1)
+    fig.add_trace(go.Bar(x=[0], y=[1], marker_color="#1f77b4", text=["1"],
+                         textposition="outside"), row=2, col=1)
+    fig.add_trace(go.Waterfall(x=[0], y=[1], text=["+1"], textposition="outside",
+                               increasing={"marker": {"color": "#2ca02c"}},
+                               decreasing={"marker": {"color": "#d62728"}},
+                               totals={"marker": {"color": "gold"}}), row=2, col=1)
+    fig.add_hline(y=0, line_dash="dash", line_color="green", annotation_text="warm", row=1, col=1)
+    fig.add_annotation(text="warm", x=0, y=0, showarrow=True, bgcolor="white", row=1, col=1)
+    fig.update_layout(template="plotly_white", hovermode="x unified",
+                      legend=dict(orientation="h"), margin=dict(t=10))
+    fig.update_xaxes(tickformat="%m-%d %H:%M", showgrid=True, matches="x", row=2, col=1)
+    fig.update_yaxes(fixedrange=True, autorange=True, title_text="warm", row=1, col=1)
+    fig.to_html(include_plotlyjs="cdn", full_html=False)
+
+    # Table subplots live in their own grid (add_hline rejects mixed grids)
+    table_fig = make_subplots(rows=1, cols=2, specs=[[{"colspan": 2, "type": "table"}, None]])
+    table_fig.add_trace(go.Table(header=dict(values=["<b>warm</b>"], fill_color="#1f77b4"),
+                                 cells=dict(values=[["warm"]], format=[""], height=30)), row=1, col=1)
+    table_fig.to_json()
+
+    get_plotlyjs()
+
+    return time.perf_counter() - t0
+
+
+def serve(conn, warm: bool = True):
+    """
+    Worker loop. Receives (kind, args, kwargs) tuples on `conn` and replies
+    with ("ok", seconds) or ("error", message). `None` or a closed pipe stops it.
+    """
+    warm_s = prewarm() if warm else 0.0
+    conn.send(("ready", warm_s))
+
+    while True:
+        try:
+            msg = conn.recv()
+        except EOFError:
+            break
+        if msg is None:
+            break
+
+        kind, args, kwargs = msg
+        try:
+            func = _resolve(kind)
+            t0 = time.perf_counter()
+            func(*args, **kwargs)
+            conn.send(("ok", time.perf_counter() - t0))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+    conn.close()
+
+
+class RenderWorker:
+    """
+    Parent-side handle for a renderer worker running in a fresh ("spawn")
+    interpreter, so the parent's imports never leak into the worker.
+
+        with RenderWorker() as worker:
+            worker.render("dashboard", results)
+            worker.render("cabinets", results_by_cabinet, optimal_cabinet=12)
+    """
+
+    def __init__(self, warm: bool = True):
+        self.warm = warm
+        self.startup_s = None   # spawn + prewarm, measured from the parent
+        self.prewarm_s = None   # prewarm only, measured inside the worker
+        self._conn = None
+        self._proc = None
+
+    def start(self):
+        ctx = mp.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe()
+        t0 = time.perf_counter()
+        self._proc = ctx.Process(target=serve, args=(child_conn, self.warm), daemon=True)
+        self._proc.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+        try:
+            _, self.prewarm_s = self._conn.recv()
+        except EOFError:
+            self.close()
+            raise RuntimeError("Render worker exited during startup (see its traceback above).")
+        self.startup_s = time.perf_counter() - t0
+        return self
+
+    def render(self, kind: str, *args, **kwargs) -> float:
+        """Render one figure in the worker; returns in-worker render time (s)."""
+        if self._conn is None:
+            raise RuntimeError("Render worker is not running; call start() first.")
+        self._conn.send((kind, args, kwargs))
+        status, payload = self._conn.recv()
+        if status != "ok":
+            raise RuntimeError(f"Render '{kind}' failed: {payload}")
+        return payload
+
+    def close(self):
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._conn.close()
+            self._conn = None
+        if self._proc is not None:
+            self._proc.join(timeout=5)
+            if self._proc.is_alive():
+                self._proc.terminate()
+            self._proc = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()